@@ -1,4 +1,3 @@
 #!/bin/bash
 
 mpremote mip install github:stefansjs/rp2_dht_reader@v2.1
-mpremote mip install github:stefansjs/micropython-tomli@v2.0-lite
@@ -0,0 +1,29 @@
+# Freezes the drybox app into a custom rp2 firmware so it doesn't get parsed and compiled from the filesystem on every
+# boot. Build from a micropython checkout with:
+#
+#   make -C ports/rp2 BOARD=RPI_PICO FROZEN_MANIFEST=/path/to/FilamentDehydrator/manifest.py
+#
+# sys.path searches the filesystem ('') before '.frozen', so any copy of the frozen files left on the board shadows the
+# frozen one and freezing does nothing. Only upload main.py, test.py and config.toml, and delete blink.py, config.py,
+# drybox/, microapp/ and pico/ from the board, or add them to MicroPico's ignore list so "Upload project" skips them.
+# The rp2_dht_reader dependency from install_deps.sh is still installed with mip.
+#
+# opt=3 drops asserts and line-number info from the bytecode (MicroPython never keeps docstrings).
+
+include("$(PORT_DIR)/boards/manifest.py")
+
+freeze(
+    "python",
+    (
+        "blink.py",
+        "config.py",
+        "drybox/__init__.py",
+        "drybox/drybox.py",
+        "drybox/hardware.py",
+        "microapp/__init__.py",
+        "microapp/microapp.py",
+        "pico/cycle.py",
+        "pico/pin.py",
+    ),
+    opt=3,
+)
@@ -34,23 +34,49 @@ class Blink:
         return on_time_ms, off_time_ms
     
 
+# The RP2040's PWM slices can't divide the system clock down much below 8Hz, so only patterns at or above this are
+# handed to the hardware. Slower ones are still blinked in software.
+_PWM_MIN_FREQUENCY_HZ = 8
+
+# (name, on_ms, off_ms, pwm_duty_u16) for every named pattern, rounded once so main() only sleeps. pwm_duty_u16 is None
+# for patterns too slow for PWM.
+_PATTERN_TABLE = tuple(
+    (name,) + tuple(map(round, Blink.blink_time_ms(cycle)))
+    + ((round(cycle.duty_cycle * 65535) if cycle.frequency >= _PWM_MIN_FREQUENCY_HZ else None),)
+    for name, cycle in Blink.by_name.items()
+)
+
 
 def main():
     from drybox.hardware import Pico
+    from machine import Pin, PWM
     import utime
     
+    led = Pico.PICO_LED
+    led_on = led.on
+    led_off = led.off
+    sleep_ms = utime.sleep_ms
     while True:
-        for status_name, status in Blink.by_name.items():
+        for status_name, on_time_ms, off_time_ms, pwm_duty_u16 in _PATTERN_TABLE:
             print(f"Status: {status_name}")
+            period_ms = on_time_ms + off_time_ms
             ms_remaining = 5_000
+
+            if pwm_duty_u16 is not None:
+                # the PWM hardware blinks the LED while we sleep through the whole window
+                pwm = PWM(led, freq=round(1000 / period_ms), duty_u16=pwm_duty_u16)
+                sleep_ms(ms_remaining)
+                pwm.deinit()
+                led.init(Pin.OUT)
+                continue
+
             while ms_remaining > 0:
-                on_time_ms, off_time_ms = Blink.blink_time_ms(status)
-                ms_remaining -= on_time_ms + off_time_ms
+                ms_remaining -= period_ms
 
-                Pico.PICO_LED.on()
-                utime.sleep_ms(round(on_time_ms))
-                Pico.PICO_LED.off()
-                utime.sleep_ms(round(off_time_ms))
+                led_on()
+                sleep_ms(on_time_ms)
+                led_off()
+                sleep_ms(off_time_ms)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,65 @@
+"""
+A line-by-line reader for the small subset of TOML that config.toml uses, so the Pico doesn't need a full TOML parser.
+Shared by main.py, which picks the app to run, and the drybox app.
+"""
+
+def parse_config(lines):
+    """
+    Parse the small subset of TOML that config.toml uses, line by line, into nested dicts.
+
+    Supported: `# comments`, `[dotted.section]` headers, and `key = value` where value is an int, float, bool, or
+    quoted string. Anything fancier (arrays, inline tables, multi-line strings) raises a ValueError.
+    """
+    config_dict = {}
+    table = config_dict
+    for line_number, line in enumerate(lines, 1):
+        line = _strip_comment(line).strip()
+        if not line:
+            continue
+
+        if line.startswith('['):
+            if not line.endswith(']'):
+                raise ValueError(f"Config line {line_number} has an unterminated section header: {line}")
+            table = config_dict
+            for name in line[1:-1].split('.'):
+                table = table.setdefault(name.strip(), {})
+            continue
+
+        key, equals, value = line.partition('=')
+        if not equals:
+            raise ValueError(f"Config line {line_number} is not a 'key = value' pair: {line}")
+        table[key.strip()] = _parse_value(value.strip(), line_number)
+
+    return config_dict
+
+def _strip_comment(line):
+    quote = None
+    for i, char in enumerate(line):
+        if quote is not None:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == '#':
+            return line[:i]
+    return line
+
+def _parse_value(text, line_number):
+    if text[:1] in ('"', "'"):
+        if len(text) < 2 or text[-1] != text[0]:
+            raise ValueError(f"Config line {line_number} has an unterminated string: {text}")
+        return text[1:-1]
+    if text == "true":
+        return True
+    if text == "false":
+        return False
+
+    number = text.replace('_', '')
+    try:
+        return int(number)
+    except ValueError:
+        pass
+    try:
+        return float(number)
+    except ValueError:
+        raise ValueError(f"Config line {line_number} has an unsupported value: {text}")
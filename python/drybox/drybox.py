@@ -1,23 +1,30 @@
 from array import array
 import asyncio
-import os
+import gc
+import sys
 
 #micropython imports
-from machine import Pin
+from machine import Pin, Timer
+import micropython
+from micropython import const
 from pico.cycle import SlowCycle
 import utime
 
-# installed packages
-import tomli as toml
-
 # local imports
 from blink import Blink
+from config import parse_config
 from drybox import hardware
 from drybox.hardware import Pico
 from microapp.microapp import MicroApp
 
 DEFAULT_CONFIG_PATH = "/config.toml"
 
+# Chatty progress output; const() lets the compiler drop the `if _DEBUG:` blocks entirely
+_DEBUG = const(False)
+
+# pico temperature; hygrometer temperature; humidity; timestamp. %-formatting is much cheaper than str.format here
+_READING_FMT = "%s;%s;%s;%d:%02d:%02d:T%02d:%02d:%02d\n"
+
 def build(config=None):
     """
     Build the drybox from the configuration.
@@ -30,7 +37,9 @@ def build(config=None):
     """
     config = validate_config(config) if config else read_config(DEFAULT_CONFIG_PATH)
     hardware_config = config['hardware']
-    heater = hardware.Heater(hardware_config['heater_pin'])
+    # switch logging from the heater and fan controllers
+    verbose = config.get('verbose', False)
+    heater = hardware.Heater(hardware_config['heater_pin'], verbose=verbose)
     hygrometer = hardware.Hygrometer(hardware_config['hygrometer_pin'])
     recirculation_fan = Pin(hardware_config['recirculation_fan_pin'], Pin.OUT)
     exhaust_fan = Pin(hardware_config['exhaust_fan_pin'], Pin.OUT)
@@ -40,15 +49,18 @@ def build(config=None):
     heater = hardware.TemperatureController(
         heater,
         hygrometer, 
-        hysteresis_c=control_config.get('heater_hysteresis', 2)
+        hysteresis_c=control_config.get('heater_hysteresis', 2),
+        verbose=verbose
     )
     recirculation_fan = SlowCycle(
         recirculation_fan, 
         cycle_percent=control_config.get('recirculation_cycle_percent', 0.1),
-        cycle_period_s=control_config.get('recirculation_cycle_period_s', 180)
+        cycle_period_s=control_config.get('recirculation_cycle_period_s', 180),
+        verbose=verbose
     )
 
-    print(f"Built heater={hardware_config['heater_pin']}, hygrometer={hardware_config['hygrometer_pin']}, recirculation_fan={hardware_config['recirculation_fan_pin']}, exhaust_fan={hardware_config['exhaust_fan_pin']}")
+    if _DEBUG:
+        print(f"Built heater={hardware_config['heater_pin']}, hygrometer={hardware_config['hygrometer_pin']}, recirculation_fan={hardware_config['recirculation_fan_pin']}, exhaust_fan={hardware_config['exhaust_fan_pin']}")
 
     # optional components
     screen = None
@@ -58,29 +70,37 @@ def build(config=None):
     return dehydrator
 
 
-class Status:
-    UNKNOWN = 0
-    ERROR = -1
-    STARTING = 1
+# Drybox states
+STATUS_UNKNOWN = const(0)
+STATUS_ERROR = const(-1)
+STATUS_STARTING = const(1)
 
-    # Running states
-    RUNNING = 10
-    HEATING = 11
-    EXHAUSTING = 12
-    TARGET_REACHED = 13
+# Running states
+STATUS_RUNNING = const(10)
+STATUS_HEATING = const(11)
+STATUS_EXHAUSTING = const(12)
+STATUS_TARGET_REACHED = const(13)
 
 STATUS_BY_NAME = {
-    "unknown": Status.UNKNOWN,
-    "error": Status.ERROR,
-    "starting": Status.STARTING,
-    "running": Status.RUNNING,
-    "heating": Status.HEATING,
-    "exhausting": Status.EXHAUSTING,
-    "target_reached": Status.TARGET_REACHED
+    "unknown": STATUS_UNKNOWN,
+    "error": STATUS_ERROR,
+    "starting": STATUS_STARTING,
+    "running": STATUS_RUNNING,
+    "heating": STATUS_HEATING,
+    "exhausting": STATUS_EXHAUSTING,
+    "target_reached": STATUS_TARGET_REACHED
 }
 
+# Size of the blink table below. Declared ahead of DryBox because const() is only substituted into code after it.
+_NUM_STATUSES = const(STATUS_TARGET_REACHED - STATUS_ERROR + 1)
+
 
 class DryBox:
+    # Overheat checks only need to keep up with the box's thermal time constant, which is seconds
+    CHECK_PERIOD_MS = 500
+    # DHT sensors need at least a second or two between reads
+    HYGROMETER_PERIOD_MS = 2000
+
     def __init__(self, config, heater, hygrometer, recirculation_fan, exhaust_fan, screen=None):
         """
         Initialize the DryBox with the specified components.
@@ -93,8 +113,12 @@ class DryBox:
             exhaust_fan (Fan): The exhaust fan component.
         """
         # State machines are nice
-        self.state = Status.STARTING
-        asyncio.create_task(self.status_led())
+        self._new_reading = asyncio.Event()
+        self._blink_timer = Timer(-1)
+        # bound once so the timer callbacks don't allocate a new bound method on every edge
+        self._blink_on_callback = self._blink_on
+        self._blink_off_callback = self._blink_off
+        self.state = STATUS_STARTING
 
         # IO objects
         self.heater = heater
@@ -108,32 +132,36 @@ class DryBox:
         self.unsafe_temperature = config['unsafe_temperature']
         self.target_humidity = config['target_humidity']
         self.target_temperature = config['target_temperature']
+        self.verbose = config.get('verbose', False)
 
         # status
-        print(self.heater, self.thermister, self.hygrometer, self.recirculation_fan, self.exhaust_fan, self.screen)
-        self.state = Status.RUNNING
+        if _DEBUG:
+            print(self.heater, self.thermister, self.hygrometer, self.recirculation_fan, self.exhaust_fan, self.screen)
+        self.state = STATUS_RUNNING
 
     def heat(self, target_temp=None):
-        self.state = Status.HEATING
+        self.state = STATUS_HEATING
         self.heater.set_temperature(target_temp or self.target_temperature)
         self.recirculation_fan.on()
         self.exhaust_fan.off()
-        print(f"Heating to {self.target_temperature}")
+        if _DEBUG:
+            print(f"Heating to {self.target_temperature}")
 
     def stay_hot(self):
-        self.state = Status.TARGET_REACHED
+        self.state = STATUS_TARGET_REACHED
         self.heater.set_temperature(self.target_temperature)
         self.recirculation_fan.cycle()
-        print(f"Holding temperature at {self.target_temperature}")
+        if _DEBUG:
+            print(f"Holding temperature at {self.target_temperature}")
 
     def vent(self):
-        self.state = Status.EXHAUSTING
+        self.state = STATUS_EXHAUSTING
         self.heater.off()
         self.recirculation_fan.off()
         self.exhaust_fan.on()
 
     def idle(self):
-        self.state = Status.RUNNING
+        self.state = STATUS_RUNNING
         self.heater.off()
         self.recirculation_fan.off()
         self.exhaust_fan.off()
@@ -142,6 +170,8 @@ class DryBox:
         """
         Reset the DryBox to its initial state.
         """
+        # the blink timer runs outside the asyncio loop, so it has to be stopped explicitly or it'll relight the LED
+        self._blink_timer.deinit()
         Pico.PICO_LED.off()
         self.heater.off()
         self.recirculation_fan.off()
@@ -150,64 +180,90 @@ class DryBox:
 
     def turn_off_everything(self):
         print("Shutting off everything")
+        self._blink_timer.deinit()
         Pico.PICO_LED.off()
         self.heater.off()
         self.recirculation_fan.shut_down()
         self.exhaust_fan.off()
+        hardware.flush_log()
 
     def run(self, refresh_rate=3):
         self.reset()
+        self.state = STATUS_RUNNING  # restarts the status LED that reset() stopped
         refresh_period_ms = round(1000 / refresh_rate)
 
         app = self.build_microapp(refresh_period_ms)
-        app.run(100, self.check)
+        app.run(self.CHECK_PERIOD_MS, self.check)
 
 
     def build_microapp(self, refresh_period_ms):
         app = MicroApp(error_handler=self.error_handler, cancel_callback=self.turn_off_everything)
 
-        app.add_scheduled(app._repeat_with_interval(1500, self.hygrometer.try_read))
+        app.add_scheduled(self._hygrometer_loop())
         app.add_scheduled(self.recirculation_fan.run())
-        app.schedule(refresh_period_ms, self.print_readings)
-        app.schedule(refresh_period_ms, self.heater.run_loop)
+        app.schedule(refresh_period_ms, self.refresh)
+        if self.verbose:
+            # only the verbose controllers queue log lines, so there's nothing to flush otherwise
+            app.schedule(1000, hardware.flush_log)
         
         return app
 
+    def refresh(self):
+        """
+        Everything that runs at the refresh rate, fused into one scheduled task so it costs one wake-up per period.
+        """
+        self.heater.run_loop()
+        self.print_readings()
+
 
+    @micropython.native
     def check(self, _=None):
-        temp, __ = self.latest_readings()
-        if temp and temp > self.unsafe_temperature:
-            print(f"Panic! Heater is too hot: {temp}, limit {self.unsafe_temperature}")
-            self.panic()
-            return True
+        unsafe_temperature = self.unsafe_temperature
+
+        # the hygrometer's cached values only change after a read, so only re-check them when there's a new one
+        if self._new_reading.is_set():
+            self._new_reading.clear()
+            temp = self.hygrometer.get_temperature()
+            if temp is not None and temp > unsafe_temperature:
+                print(f"Panic! Heater is too hot: {temp}, limit {unsafe_temperature}")
+                self.panic()
+                return True
 
-        if self.thermister.get_temperature() > self.unsafe_temperature:
-            print(f"Panic! Thermister is too hot: {self.thermister.get_temperature()}, limit {self.unsafe_temperature}")
+        pico_temp = self.thermister.get_temperature()
+        if pico_temp > unsafe_temperature:
+            print(f"Panic! Thermister is too hot: {pico_temp}, limit {unsafe_temperature}")
             self.panic()
             return True
 
         # if humidity
 
+    async def _hygrometer_loop(self):
+        # The DHT read blocks for ~20ms, so it gets its own task at the sensor's cadence
+        while True:
+            self.hygrometer.try_read()
+            self._new_reading.set()
+            await asyncio.sleep_ms(self.HYGROMETER_PERIOD_MS)
+
     def print_readings(self):
         pico_temp = Pico.PICO_THERMISTER.get_temperature()
         temperature, humidity = self.latest_readings()
-        current_time = utime.localtime()
-        current_time = "{}:{:02d}:{:02d}:T{:02d}:{:02d}:{:02d}".format(*current_time)
-        print(";".join(map(str, [pico_temp, temperature, humidity, current_time])))
+        t = utime.localtime()
+        sys.stdout.write(_READING_FMT % (pico_temp, temperature, humidity, t[0], t[1], t[2], t[3], t[4], t[5]))
 
     def latest_readings(self):
         return self.hygrometer.get_temperature(), self.hygrometer.get_humidity()
     
     def panic(self):
-        self.heater.off()
+        self.heater.latch_off()
+        # steady on, and it stays that way after the app dies since nothing re-arms the blink timer
+        self.state = STATUS_ERROR
         self.exhaust_fan.on()
         self.recirculation_fan.on()
 
         if self.screen is not None:
             self.screen.display("OVERHEATED")
             self.screen.display(f"{self.heater.get_temperature()}℃")
-            
-        os.system("sudo shutdown -h now")
+
         raise RuntimeError("Panic! Heater is on.")
     
     def error_handler(self, func, error):
@@ -216,35 +272,65 @@ class DryBox:
             return False
         return False
     
-    async def status_led(self):
-        while True:
-            on_time_ms, off_time_ms = self._get_blink_pattern(self.state)
-            Pico.PICO_LED.on()
-            await asyncio.sleep_ms(round(on_time_ms))
-            if off_time_ms > 0:
-                Pico.PICO_LED.off()
-                await asyncio.sleep_ms(round(off_time_ms))
+    @property
+    def state(self):
+        return self._state
+
+    @state.setter
+    def state(self, state):
+        self._state = state
+        self._blink_pattern_ms = self._get_blink_pattern(state)
+        self._blink_on(None)
+
+    # The status LED is driven entirely by a hardware timer: each callback sets the LED and re-arms a one-shot for the
+    # next edge, so blinking never wakes the asyncio loop. Changing state restarts the pattern immediately.
+    def _blink_on(self, _timer):
+        Pico.PICO_LED.on()
+        on_time_ms, off_time_ms = self._blink_pattern_ms
+        if off_time_ms == 0:
+            # steady-on: nothing to toggle until the state changes
+            self._blink_timer.deinit()
+            return
+        self._blink_timer.init(mode=Timer.ONE_SHOT, period=on_time_ms, callback=self._blink_off_callback)
+
+    def _blink_off(self, _timer):
+        Pico.PICO_LED.off()
+        self._blink_timer.init(mode=Timer.ONE_SHOT, period=self._blink_pattern_ms[1], callback=self._blink_on_callback)
 
 
     STATUS_LED_PATTERNS ={
-        Status.ERROR: Blink.CONSTANT,
-        Status.UNKNOWN: Blink.WARNING,
-        Status.STARTING: Blink.SLOW_CALM,
-        Status.HEATING: Blink.ACTIVE_CALM,
-        Status.EXHAUSTING: Blink.ACTIVE,
-        Status.RUNNING: Blink.IDLE_CALM,
-        Status.TARGET_REACHED: Blink.IDLE_FAST,
+        STATUS_ERROR: Blink.CONSTANT,
+        STATUS_UNKNOWN: Blink.WARNING,
+        STATUS_STARTING: Blink.SLOW_CALM,
+        STATUS_HEATING: Blink.ACTIVE_CALM,
+        STATUS_EXHAUSTING: Blink.ACTIVE,
+        STATUS_RUNNING: Blink.IDLE_CALM,
+        STATUS_TARGET_REACHED: Blink.IDLE_FAST,
     }
 
     @classmethod
+    @micropython.native
     def _get_blink_pattern(cls, state):
-        fallback = cls.STATUS_LED_PATTERNS[Status.UNKNOWN]
-        return Blink.blink_time_ms(cls.STATUS_LED_PATTERNS.get(state, fallback))
+        index = state - STATUS_ERROR
+        if 0 <= index < _NUM_STATUSES:
+            return _BLINK_MS_BY_STATUS[index]
+        return _UNKNOWN_BLINK_MS
     
     def _error_callback(self, func, exception):
-        self.state = Status.ERROR
-        Pico.PICO_LED.on()
+        self.state = STATUS_ERROR
+
 
+# Blink timings never change, so compute (on_ms, off_ms) for every status once at import, already rounded for sleep_ms
+def _blink_ms(pattern):
+    on_time_ms, off_time_ms = Blink.blink_time_ms(pattern)
+    return int(round(on_time_ms)), int(round(off_time_ms))
+
+# Statuses are small ints, so the table is a tuple indexed by `status - STATUS_ERROR` rather than a dict
+_UNKNOWN_BLINK_MS = _blink_ms(DryBox.STATUS_LED_PATTERNS[STATUS_UNKNOWN])
+_BLINK_MS_BY_STATUS = tuple(
+    _blink_ms(DryBox.STATUS_LED_PATTERNS[status]) if status in DryBox.STATUS_LED_PATTERNS else _UNKNOWN_BLINK_MS
+    for status in range(STATUS_ERROR, STATUS_TARGET_REACHED + 1)
+)
 
 
 class Dehydrator:
@@ -277,7 +363,7 @@ class Dehydrator:
     def run(self):
         app = self.drybox.build_microapp(self._sample_period_ms)
         app.add_scheduled(self.dry_filament())
-        app.run(100, self.drybox.check)
+        app.run(self.drybox.CHECK_PERIOD_MS, self.drybox.check)
         
     
     
@@ -306,6 +392,7 @@ class Dehydrator:
         # Let the values settle a little bit
         print(f"Wait for measurements to settle {self.sensor_settle_duration_s} s")
         self.drybox.stay_hot()
+        gc.collect()
         await asyncio.sleep(self.sensor_settle_duration_s)
 
         # We should do at least one moisture absorption cycle before checking if we've reached our target
@@ -344,79 +431,111 @@ class Dehydrator:
         if start_temp <= 0 or start_temp >= 100:
             raise ValueError(f"temperature seems invalid: {start_temp}")
         
-        timeout_ms = int(round(timeout_s or self.timeout_s))
+        timeout_ms = int(round((timeout_s or self.timeout_s) * 1000))
         
         hysteresis = self.drybox.heater.temp_hysteresis
         settled_delay_s = self.sensor_settle_duration_s
-        settled_delay_samples = settled_delay_s * self.sample_rate
+        settled_delay_samples = int(round(settled_delay_s * self.sample_rate))
         settled_samples = 0
 
+        get_temp = self.drybox.hygrometer.get_temperature
+        ticks_ms = utime.ticks_ms
+        ticks_diff = utime.ticks_diff
+        sleep_ms = asyncio.sleep_ms
+        sample_period_ms = self._sample_period_ms
+        low_temp = target_temp - hysteresis
+        high_temp = target_temp + hysteresis
+
         self.drybox.heat(target_temp)
-        start_time = current_time = utime.ticks_ms()
+        deadline = utime.ticks_add(ticks_ms(), timeout_ms)
         while True:
-            current_temp = self.temp
+            sample_time = ticks_ms()
+            current_temp = get_temp()
 
             # Check loop pre-conditions
-            if utime.ticks_diff(current_time, start_time) >= timeout_ms:
+            if ticks_diff(sample_time, deadline) >= 0:
                 return False
             
             # count how many times we've measured
             if target_temp is None or current_temp is None:
                 print("Missing temperature")
-            if target_temp - current_temp > hysteresis:
-                settled_samples = 0
-            elif current_temp - target_temp > hysteresis:
-                settled_samples = 0
-            elif settled_samples < settled_delay_samples:
+            if low_temp <= current_temp <= high_temp:
                 settled_samples += 1
+                if settled_samples >= settled_delay_samples:
+                    return True
             else:
-                return True
+                settled_samples = 0
 
-            await asyncio.sleep_ms(self._sample_period_ms)
+            # only sleep for what's left of the sample period; just yield if we're already late
+            delay_ms = sample_period_ms - ticks_diff(ticks_ms(), sample_time)
+            if delay_ms > 0:
+                await sleep_ms(delay_ms)
+            else:
+                await asyncio.sleep(0)
 
 
     async def absorb_moisture(self, timeout_s=60*60):
-        start_time = utime.ticks_ms()
+        get_humidity = self.drybox.hygrometer.get_humidity
+        ticks_ms = utime.ticks_ms
+        sleep = asyncio.sleep
+        collect = gc.collect
+
+        start_time = ticks_ms()
         self.drybox.stay_hot()
-        print(f"Absorbing moistrue cycle at {self.drybox.target_temperature}")
+        if _DEBUG:
+            print(f"Absorbing moistrue cycle at {self.drybox.target_temperature}")
 
         # What I expect to happen is that I will start with a very low humidity (probably below the target humidity)
         # and gradually increase the moisture as the warm air takes moisture out of the filament. 
         # Once we reach some kind of settled value, I'll return that value and let an outer loop handle the rest
 
-        humidity_readings =  [0]*self._num_measurements
-        for i in range(self._num_measurements): # The number of starting readings that I need
-            humidity_readings[i] = self.humidity
-            print(humidity_readings[:i+1])
-            await asyncio.sleep(self.measurement_interval_s)
+        # Fixed-size ring buffer: `head` points at the oldest reading, the newest sits just before it
+        num_measurements = self._num_measurements
+        humidity_readings = array('f', [0.0] * num_measurements)
+        head = 0
+        filled = 0
+        while filled < num_measurements: # The number of starting readings that I need
+            humidity = get_humidity()
+            # a missed reading is retried next interval rather than filled in, so the starting slope is only real data
+            if humidity is not None:
+                humidity_readings[filled] = humidity
+                if _DEBUG:
+                    print(filled, humidity)
+                filled += 1
+            elif did_timeout(start_time, ticks_ms(), timeout_s*1000):
+                raise RuntimeError(f"Only got {filled} of {num_measurements} humidity readings in {timeout_s}s")
+            # collect at the sample boundary, so an automatic collection mid-interval is less likely (GC stays enabled)
+            collect()
+            await sleep(self.measurement_interval_s)
 
         # Do I need some smoothing?
-        def get_slope(readings, fallback=None):
-            if None in readings[-1:1]:
-                return fallback
-            return (readings[-1] - readings[0]) / self._num_measurements
+        # The window length is fixed, so comparing the rise across the window is the same as comparing slopes
+        # without dividing on every reading
+        def get_rise(readings, head):
+            return readings[(head - 1) % num_measurements] - readings[head]
         
-        starting_slope = get_slope(humidity_readings)
-        print(f"Initial humidity: {humidity_readings[0]}-{humidity_readings[-1]}, with a slope of {starting_slope} %/s")
-
-        target_slope = self.slope_threshold * starting_slope
-        current_slope = starting_slope
-        current_time = utime.ticks_ms()
-        while current_slope > target_slope and not did_timeout(start_time, current_time, timeout_s*1000):
-            await asyncio.sleep(self.measurement_interval_s)
+        starting_rise = get_rise(humidity_readings, head)
+        if _DEBUG:
+            print(f"Initial humidity: {humidity_readings[0]}-{humidity_readings[-1]}, with a slope of {starting_rise / num_measurements} %/s")
+
+        target_rise = self.slope_threshold * starting_rise
+        current_rise = starting_rise
+        current_time = ticks_ms()
+        while current_rise > target_rise and not did_timeout(start_time, current_time, timeout_s*1000):
+            collect()
+            await sleep(self.measurement_interval_s)
             
-            humidity = self.humidity
+            humidity = get_humidity()
             if humidity is not None:
-                humidity_readings.pop(0)
-                humidity_readings.append(humidity)
-                current_slope = get_slope(humidity_readings)
+                humidity_readings[head] = humidity
+                head = (head + 1) % num_measurements
+                current_rise = get_rise(humidity_readings, head)
             
-            current_time = utime.ticks_ms()
-            print(f"humidity: {humidity_readings}, slope: {current_slope}, target slope: {target_slope}")
-            if current_slope is None:
-                current_slope = target_slope
+            current_time = ticks_ms()
+            if _DEBUG:
+                print(f"humidity: {humidity_readings}, head: {head}, rise: {current_rise}, target rise: {target_rise}")
 
-        return humidity_readings[-1]
+        return humidity_readings[(head - 1) % num_measurements]
 
 
 
@@ -426,8 +545,8 @@ def did_timeout(ticks_start, ticks_end, timeout_ticks):
 
 def read_config(path=DEFAULT_CONFIG_PATH):
     try:
-        with open(path, "rb") as f:
-            config_dict = toml.load(f)
+        with open(path, "r") as f:
+            config_dict = parse_config(f)
     except OSError:
         print("File error with config file: ", path)
         raise
@@ -439,31 +558,41 @@ def read_config(path=DEFAULT_CONFIG_PATH):
     validate_config(drybox_config)
     return drybox_config
 
+# (section, keys) that build() and the controllers index directly. A section of None means the top-level drybox table.
+_REQUIRED_KEYS = (
+    (None, ('target_humidity', 'target_temperature', 'unsafe_temperature')),
+    ('hardware', ('heater_pin', 'hygrometer_pin', 'recirculation_fan_pin', 'exhaust_fan_pin')),
+    ('controls', ('timeout_s', 'sample_rate', 'exhaust_duration_s')),
+)
+
 def validate_config(config):
     if 'drybox' in config:
         config = config['drybox']
 
     if 'version' not in config:
         raise ValueError("Config file is missing a version. I won't know how to read it.")
-    version = config['version'].split('.')
     
     # for now, before we make a 1.0 release, we'll only accept 1.0a
-    if version != ['1', '0a']:
+    if config['version'] != '1.0a':
         raise ValueError(f"Config file version {config['version']} is not supported. I only support 1.0a.")
     
-    required_keys = {
-        'hardware': ['heater_pin', 'hygrometer_pin', 'recirculation_fan_pin', 'exhaust_fan_pin'],
-        'pid': ['target_humidity', 'dehumidify_temperature']
-    }
-    
     errors = []
-    for key, subkeys in required_keys.items():
-        if key not in config:
+    for key, subkeys in _REQUIRED_KEYS:
+        if key is None:
+            table = config
+        elif key not in config:
             errors.append(f"Config file is missing required key: {key}")
             continue
+        else:
+            table = config[key]
+
         for subkey in subkeys:
-            if subkey not in config[key]:
-                errors.append(f"Config file is missing required subkey: {key}.{subkey}")
+            if subkey not in table:
+                errors.append(f"Config file is missing required subkey: {key}.{subkey}" if key else
+                              f"Config file is missing required key: {subkey}")
+
+    if errors:
+        raise ValueError("; ".join(errors))
     
     return config
 
@@ -476,22 +605,27 @@ def main():
     
 
 async def cycle_hardware(drybox):
-    print("Starting cycle_hardware")
+    if _DEBUG:
+        print("Starting cycle_hardware")
     
     while True:
-        print("heating")
+        if _DEBUG:
+            print("heating")
         drybox.heat()
         await asyncio.sleep(2)
 
-        print("Recirculating")
+        if _DEBUG:
+            print("Recirculating")
         drybox.stay_hot()
         await asyncio.sleep(10)
 
-        print("Venting")
+        if _DEBUG:
+            print("Venting")
         drybox.vent()
         await asyncio.sleep(10)
 
-        print("Idling")
+        if _DEBUG:
+            print("Idling")
         drybox.idle()
         await asyncio.sleep(10)
 
@@ -1,46 +1,90 @@
 import asyncio
+import sys
 from pico.pin import Analog  # Import Pin and ADC from the machine module
 
 # micropython imports
 from machine import Pin, PWM
+import micropython
+from micropython import const
 import utime
 from rp2_dht_reader import DhtReader
 
 
+_U16_MAX = const(65535)
+_UNSAFE_TEMPERATURE = const(70)
+_UNSAFE_PICO_TEMPERATURE = const(85)  # From Pico datasheet
+
+
 class UnsafeTemperature(Exception):
     pass
 
 
+# Diagnostic lines from fast paths are queued here and written out by flush_log(), so toggling a pin never has to
+# wait on the UART. Lines past the limit are dropped rather than growing the heap if nobody is flushing.
+_LOG_LIMIT = 32
+_log_lines = []
+
+def queue_log(line):
+    if len(_log_lines) < _LOG_LIMIT:
+        _log_lines.append(line)
+
+def flush_log():
+    write = sys.stdout.write
+    for line in _log_lines:
+        write(line)
+    _log_lines.clear()
+
+
 class Thermister:
     def __init__(self, pin, min_temp: float = 0, max_temp: float = 100, sensor_scaling: float = 1):
         self.pin = Analog(pin, scale=sensor_scaling, offset=min_temp if sensor_scaling > 0 else max_temp)
         self.min_temp = min_temp
         self.max_temp = max_temp
         self.sensor_scaling = sensor_scaling
+        # scale and offset are already folded into Analog, so a read is just this bound method
+        self._read = self.pin.read_float
+        self._last_tick = None
+        self._last_value = None
         
 
     def get_temperature(self) -> float:
         """
-        Returns temperature in Celsius.
+        Returns temperature in Celsius. Callers within the same millisecond share one ADC read.
         """
-        return self.pin.read_float() 
+        now = utime.ticks_ms()
+        if now == self._last_tick:
+            return self._last_value
+        value = self._read()
+        self._last_tick = now
+        self._last_value = value
+        return value
     
+    @micropython.native
     def get_temperature_fahrenheit(self) -> float:
         """
         Returns temperature in Fahrenheit.
         """
-        return self.get_temperature() * 9 / 5 + 32
+        return self.get_temperature() * 1.8 + 32.0
+
+
+def c_to_f(celsius: float) -> float:
+    """
+    Converts a temperature you've already read in Celsius to Fahrenheit.
+    """
+    return celsius * 1.8 + 32.0
 
 
 class Heater:
-    def __init__(self, pin: int):
+    def __init__(self, pin: int, verbose=False):
         """
         Initialize the heater with a pin and an optional unsafe temperature.
 
         Args:
             pin (int): The pin number for the heater.
             unsafe_temperature (int, optional): The temperature at which the heater is considered unsafe. Defaults to 65.
+            verbose (bool, optional): Log every time the heater switches. Defaults to False.
         """
+        self.verbose = verbose
         self.pin = Pin(pin, Pin.OUT, pull=Pin.PULL_DOWN)
         self.pin.off()
         self.is_on = False
@@ -56,7 +100,8 @@ class Heater:
         
         self.pin.on()
         self.is_on = True
-        print("Heater is ON")
+        if self.verbose:
+            queue_log("Heater is ON\n")
 
     def off(self, force=False):
         """
@@ -67,16 +112,25 @@ class Heater:
         
         self.pin.off()
         self.is_on = False
-        print("Heater is OFF")
+        if self.verbose:
+            queue_log("Heater is OFF\n")
+
+    def latch_off(self):
+        """
+        Turn off the heater and switch its pin to a pulled-down input, so nothing can drive it high again.
+        """
+        self.off(force=True)
+        self.pin.init(Pin.IN, pull=Pin.PULL_DOWN)
 
 
 class TemperatureController:
-    UNSAFE_TEMPERATURE = 70
-    UNSAFE_PICO_TEMPERATURE = 85  # From Pico datasheet
+    UNSAFE_TEMPERATURE = _UNSAFE_TEMPERATURE
+    UNSAFE_PICO_TEMPERATURE = _UNSAFE_PICO_TEMPERATURE
 
 
-    def __init__(self, heater, thermister, hysteresis_c=1, max_temperature: int = UNSAFE_TEMPERATURE):
+    def __init__(self, heater, thermister, hysteresis_c=1, max_temperature: int = UNSAFE_TEMPERATURE, verbose=False):
         self.max_temperature = max_temperature
+        self.verbose = verbose
         
         self.heater = heater
         self.thermister = thermister
@@ -90,25 +144,32 @@ class TemperatureController:
 
     def set_temperature(self, temp):
         self._target_temperature = temp
-        if self.state == "running":
+        if self.verbose and self.state == "running":
             print(f"Setting temperature to {temp}")
 
     def off(self):
         self._target_temperature = None
         self.heater.off()
 
+    def latch_off(self):
+        self._target_temperature = None
+        self.heater.latch_off()
+
     def run_loop(self):
         TemperatureController.check(self)
         
+        target_temperature = self._target_temperature
         temp = self.get_temperature()
-        if self._target_temperature is not None and temp is not None:
-            if temp < self._target_temperature - self.temp_hysteresis:
-                self.heater.on()
-            elif temp > self._target_temperature + self.temp_hysteresis:
-                self.heater.off()
-        
-        else:
+        if target_temperature is None or temp is None:
             self.state = "waiting for temperature"
+            return
+
+        hysteresis = self.temp_hysteresis
+        diff = temp - target_temperature
+        if diff < -hysteresis:
+            self.heater.on()
+        elif diff > hysteresis:
+            self.heater.off()
 
     async def run(self, check_interval_ms):
         TemperatureController.check(self)
@@ -133,21 +194,22 @@ class TemperatureController:
         """
         Check if the heater is in a safe state. If the temperature exceeds the unsafe limit, panic.
         """
-        temp = Pico.PICO_THERMISTER.get_temperature()
-        if temp is not None and temp > TemperatureController.UNSAFE_PICO_TEMPERATURE:
+        pico_temp = Pico.PICO_THERMISTER.get_temperature()
+        if pico_temp is not None and pico_temp > _UNSAFE_PICO_TEMPERATURE:
             print("Pico overheating!")
             for heater in heaters:
                 heater.off()
-            raise UnsafeTemperature(f"Pico exceeded it's safe operating temperature: {temp} > {TemperatureController.UNSAFE_PICO_TEMPERATURE}")
+            raise UnsafeTemperature(f"Pico exceeded it's safe operating temperature: {pico_temp} > {_UNSAFE_PICO_TEMPERATURE}")
 
         for heater in heaters:
             temp = heater.get_temperature()
-            if temp is not None and temp > heater.max_temperature:
+            max_temperature = heater.max_temperature
+            if temp is not None and temp > max_temperature:
                 print("Panic! Unsafe temperature detected.")
-                for heater in heaters:
-                    heater.off()
+                for other in heaters:
+                    other.off()
         
-                raise UnsafeTemperature(f"a heater went beyond its configured max temperature: {heater.pin}, {temp} > {heater.max_temperature}")
+                raise UnsafeTemperature(f"a heater went beyond its configured max temperature: {heater.heater.pin}, {temp} > {max_temperature}")
         
         return True
 
@@ -158,51 +220,83 @@ class Fan:
     """
     PWM fan control with independ notions of duty cycle and on/off
     """
-    U16_MAX = 65535
+    U16_MAX = _U16_MAX
 
-    def __init__(self, pin, freq=10_000, duty_cycle=0.5, kick_start_ms=1000):
+    def __init__(self, pin, freq=10_000, duty_cycle=0.5, kick_start_ms=1000, verbose=False):
         self.pin = pin
+        self.verbose = verbose
         self.pwm = PWM(pin, freq=freq, duty_u16=0)  # Start in an OFF state
         self.is_on = False
         self.kick_start_ms = kick_start_ms
 
-        self._duty_cycle = int(round(duty_cycle * Fan.U16_MAX))
-        self._background_task = None
+        # Keep both the fraction and the raw PWM value so neither side has to convert on read
+        self._duty_float = duty_cycle
+        self._duty_u16 = int(round(duty_cycle * _U16_MAX))
+        # One long-lived controller task, started on first use, is signalled by on()/off() instead of spawning and
+        # cancelling a kick-start task on every toggle.
+        self._on_event = asyncio.Event()
+        self._off_event = asyncio.Event()
+        self._controller_task = None
 
     @property
     def duty_cycle(self):
-        return self._duty_cycle / self.U16_MAX
+        return self._duty_float
     
     @duty_cycle.setter
     def duty_cycle(self, value):
         """ Sets duty cycle as a percentage from 0 to 1 """
-        self._duty_cycle = int(round(value * Fan.U16_MAX))
+        self._duty_float = value
+        self._duty_u16 = int(round(value * _U16_MAX))
         if self.is_on:
-            self.pwm.duty_u16(self._duty_cycle)
+            self.pwm.duty_u16(self._duty_u16)
 
     def on(self):
-        print(f"Turning on at {self.duty_cycle*100}%")
-        if self._background_task is None or self._background_task.done():
-            self._background_task = asyncio.create_task(self.kick_start())
+        if self.verbose:
+            print(f"Turning on at {self._duty_float*100}%")
+        if self._controller_task is None:
+            self._controller_task = asyncio.create_task(self._controller())
+        self._off_event.clear()
+        self._on_event.set()
     
     def off(self):
-        print("Turning off PWM fan")
-        if self._background_task is not None and not self._background_task.done():
-            self._background_task.cancel()
-        if self._background_task is not None:
-            self._background_task = None
+        if self.verbose:
+            print("Turning off PWM fan")
+        self._on_event.clear()
+        self._off_event.set()
 
         self.pwm.duty_u16(0)
         self.is_on = False
 
-    async def kick_start(self):
-        print(f"Kick-starting fan for {self.kick_start_ms}ms")
-        self.pwm.duty_u16(Fan.U16_MAX)
-        await asyncio.sleep_ms(self.kick_start_ms)
-        
-        print(f"slowing back down to {self.duty_cycle * 100}")
-        self.pwm.duty_u16(self._duty_cycle)
-        self.is_on = True
+    async def _controller(self):
+        on_event = self._on_event
+        off_event = self._off_event
+        duty_u16 = self.pwm.duty_u16
+        while True:
+            await on_event.wait()
+            if not on_event.is_set():
+                # off() cancelled the on() before this task got to run
+                continue
+            on_event.clear()
+
+            if self.verbose:
+                print(f"Kick-starting fan for {self.kick_start_ms}ms")
+            duty_u16(_U16_MAX)
+            try:
+                # returns early if off() is called during the kick-start
+                await asyncio.wait_for_ms(off_event.wait(), self.kick_start_ms)
+            except asyncio.TimeoutError:
+                if not off_event.is_set():
+                    if self.verbose:
+                        print(f"slowing back down to {self._duty_float * 100}")
+                    duty_u16(self._duty_u16)
+                    self.is_on = True
+                    await off_event.wait()
+
+            # off() zeroes the PWM itself, but this task may have driven it since, so zero it again. If on() came
+            # straight back in, off_event is already cleared and the next pass kick-starts again instead.
+            if off_event.is_set():
+                off_event.clear()
+                duty_u16(0)
 
 
 class Hygrometer:
@@ -256,7 +350,6 @@ class Pico:
 
 def main():
     from microapp import MicroApp
-    from collections import OrderedDict
 
     hygrometer = Hygrometer()
 
@@ -264,20 +357,19 @@ def main():
     def time_since_start():
         return utime.ticks_diff(utime.ticks_ms(), start_time) / 1000
 
-    data = OrderedDict([
-        ('Pico temperature', Pico.PICO_THERMISTER.get_temperature,),
-        ('humidity', hygrometer.get_humidity,),
-        ('dht tmperature', hygrometer.get_temperature,),
+    data = (
+        ('Pico temperature', Pico.PICO_THERMISTER.get_temperature),
+        ('humidity', hygrometer.get_humidity),
+        ('dht tmperature', hygrometer.get_temperature),
         ('timestamp', time_since_start),
-    ])
+    )
 
     def main(app):
         Pico.PICO_LED.toggle()
-        values = [str(getter()) for getter in data.values()]
-        print("; ".join(values))
+        print("; ".join(str(getter()) for _, getter in data))
 
 
     MicroApp.RESET_RUN_LOOP()
     app = MicroApp(verbose=False)
-    app.schedule(2000, hygrometer.try_read)
+    app.schedule(1000, hygrometer.try_read)
     app.run(400, main)
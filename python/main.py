@@ -5,47 +5,39 @@ Ideally this lets me or others choose which app to run by editing the config.tom
 in the editor or making code-changes.
 """
 
-import tomli as toml
+from config import parse_config
+
+# config "main" -> (description, module, function). Unknown names fall back to the test app.
+_APPS = {
+    "test": ("test", "test", "main"),
+    "blink": ("blink", "blink", "main"),
+    "hardware": ("hardware", "drybox.hardware", "main"),
+    "drybox": ("drybox", "drybox.drybox", "build"),
+    "drybox_test": ("drybox test app", "drybox.drybox", "main"),
+}
 
 def main():
     config = read_config()
     main = config.get("main", "test")
-    if main == "test":
-        print("Running test")
-        from test import main as test_main
-        test_main()
-
-    elif main == "blink":
-        print("Running blink")
-        from blink import main as blink_main
-        blink_main()
-
-    elif main == "hardware":
-        print("Running hardware")
-        from drybox.hardware import main as hardware_main
-        hardware_main()
-
-    elif main == "drybox":
-        print("Running drybox")
-        from drybox.drybox import build
-
-        drybox = build(config)
-        drybox.run()
+    if main not in _APPS:
+        print("no known main; running test")
+        main = "test"
 
-    elif main == "drybox_test":
-        print("Running drybox test app")
-        from drybox.drybox import main as drybox_test_main
-        drybox_test_main()
+    description, module_name, func_name = _APPS[main]
+    print(f"Running {description}")
+    # only the selected app's module gets imported
+    app_main = getattr(__import__(module_name, None, None, (func_name,)), func_name)
 
+    if main == "drybox":
+        drybox = app_main(config)
+        drybox.run()
     else:
-        print("no known main; running test")
-        from test import main as test_main
-        test_main()
+        app_main()
 
 def read_config(path="config.toml"):
     try:
-        with open(path, "rb") as f:
-            return toml.load(f)
+        with open(path, "r") as f:
+            return parse_config(f)
     except OSError as e:
         print("Config file error: ", e)
         return {}
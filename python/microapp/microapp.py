@@ -3,10 +3,24 @@ Creates an asyncio-based app that allows you to schedule some functions peridica
 """
 
 import asyncio
+import heapq
+import micropython
 import sys
 import utime
 
 
+# check count; timestamp
+_ALIVE_FMT = "alive: %d times. current time %d:%02d:%02dT%02d:%02d:%02d\n"
+
+
+def _current_task():
+    # asyncio.current_task() raises rather than returning None when called from outside a task
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return None
+
+
 class MicroApp:
     """
     The main design of this class is to provide a main function that performs tasks like safety checks, and that will
@@ -89,7 +103,13 @@ class MicroApp:
         asyncio.new_event_loop()
 
     def __init__(self, verbose=True, error_handler=None, cancel_callback=None):
-        self._scheduled_funcs = []
+        self._scheduled_tasks = []
+        self._schedule_heap = []
+        self._schedule_count = 0
+        self._scheduler_task = None
+        self._running = False
+        self._last_ticks = utime.ticks_ms()
+        self._elapsed_ms = 0
         self.check_count = 0
         self.shutdown = False
         self.verbose = verbose
@@ -99,8 +119,14 @@ class MicroApp:
     def cancel(self):
         self.shutdown = True
         print("Cancelling all scheduled tasks")
-        for task, _ in self._scheduled_funcs:
-            task.cancel()
+        # cancel() is mostly called from an error handler running inside one of these tasks, which can't cancel
+        # itself. That one stops on its own: it sees shutdown, or _main's _shutdown() cancels it.
+        current = _current_task()
+        for task in self._scheduled_tasks:
+            if task is not current:
+                task.cancel()
+        if self._scheduler_task is not None and self._scheduler_task is not current:
+            self._scheduler_task.cancel()
 
         if self.cancel_callback:
             self.cancel_callback()
@@ -116,12 +142,45 @@ class MicroApp:
             *args: Positional arguments to pass to the function.
             **kwargs: Keyword arguments to pass to the function.
         """
-        task = asyncio.create_task(self._do_periodic(interval_ms, func, *args, **kwargs))
-        self._scheduled_funcs.append([task, interval_ms])
+        # Every scheduled function shares one task that sleeps until the earliest deadline. The first call is due now.
+        # args is None marks the common no-argument case, so each call can skip the *args/**kwargs unpacking
+        self._schedule_count += 1
+        if not args and not kwargs:
+            args = kwargs = None
+        heapq.heappush(self._schedule_heap, (self._now_ms(), self._schedule_count, interval_ms, func, args, kwargs))
+
+        # Once running, restart the scheduler so it isn't still asleep waiting on a later deadline. Anything scheduled
+        # before that is picked up when _main starts it, so setting up N functions costs one task, not N.
+        # A function the scheduler is running can schedule more: the loop re-reads the heap every pass, and the task
+        # can't cancel itself, so it's left alone.
+        if self._running and _current_task() is not self._scheduler_task:
+            self._start_scheduler()
+
+    def _start_scheduler(self):
+        if self._scheduler_task is not None:
+            self._scheduler_task.cancel()
+        self._scheduler_task = asyncio.create_task(self._run_schedule())
 
     def add_scheduled(self, coroutine):
-        task = asyncio.create_task(self._wrap_coroutine(coroutine))
-        self._scheduled_funcs.append([task, None])
+        self._scheduled_tasks.append(asyncio.create_task(self._wrap_coroutine(coroutine)))
+
+    def schedule_on_event(self, pin, trigger, func, *args, **kwargs):
+        """
+        Call a function every time a pin interrupt fires rather than polling the pin. The task sleeps on a
+        ThreadSafeFlag between interrupts, so the loop can idle until something actually happens. Interrupts that
+        arrive before func has run are coalesced into one call.
+
+        Args:
+            pin (machine.Pin): The pin to watch.
+            trigger (int): The pin's irq trigger, e.g. Pin.IRQ_RISING.
+            func (callable): The function to be called.
+            *args: Positional arguments to pass to the function.
+            **kwargs: Keyword arguments to pass to the function.
+        """
+        flag = asyncio.ThreadSafeFlag()
+        # hard IRQs can't allocate, so the handler only touches names bound here
+        pin.irq(handler=lambda _pin, set_flag=flag.set: set_flag(), trigger=trigger, hard=True)
+        self.add_scheduled(self._run_on_event(flag, func, args, kwargs))
 
     def run(self, period_ms=5000, main_func=None):
         try:
@@ -130,30 +189,79 @@ class MicroApp:
             self._handle_foreground_error(main_func or MicroApp._default_main, e)
 
 
-    async def _do_periodic(self, interval_ms, func, *args, **kwargs):
+    @micropython.native
+    def _now_ms(self):
         """
-        Calls a function peridocally at a specified interval. Schedule overruns are not prevented.
-        If you have a task that may occasionally take more time than the interval period you'll be fine, 
-        but it is up to you to ensure this doesn't happen too often.
+        Milliseconds since the app was created. Unlike ticks_ms() this never wraps around, so deadlines built from it
+        can be ordered in a heap with plain comparisons.
         """
-        while True:
-            start = utime.ticks_ms()
+        now = utime.ticks_ms()
+        self._elapsed_ms += utime.ticks_diff(now, self._last_ticks)
+        self._last_ticks = now
+        return self._elapsed_ms
+
+    @micropython.native
+    async def _run_schedule(self):
+        """
+        Calls every scheduled function at its interval from one task, sleeping until the earliest deadline in
+        between. Schedule overruns are not prevented. If you have a task that may occasionally take more time than 
+        the interval period you'll be fine, but it is up to you to ensure this doesn't happen too often.
+        """
+        heap = self._schedule_heap
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+        now_ms = self._now_ms
+        sleep = asyncio.sleep
+        sleep_ms = asyncio.sleep_ms
+        handle_error = self._handle_background_error
+
+        while not self.shutdown:
+            deadline, count, interval_ms, func, args, kwargs = heap[0]
+            delay_ms = deadline - now_ms()
+            if delay_ms > 0:
+                await sleep_ms(delay_ms)
+                continue
+            if delay_ms < 0:
+                # running behind: still give other tasks a turn so catching up can't starve them. sleep(0) is a bare
+                # yield, it doesn't arm a timer the way sleep_ms does
+                await sleep(0)
+
+            # reschedule before calling so an error in func doesn't lose its slot. Deadlines advance from the previous
+            # deadline so wake-up latency doesn't accumulate, unless we've overrun a whole interval, in which case
+            # resync to now rather than calling func back-to-back to catch up
+            next_deadline = deadline + interval_ms
+            if delay_ms < -interval_ms:
+                next_deadline -= delay_ms
+            heappop(heap)
+            heappush(heap, (next_deadline, count, interval_ms, func, args, kwargs))
             try:
-                func(*args, **kwargs)
+                if args is None:
+                    func()
+                else:
+                    func(*args, **kwargs)
             except BaseException as e:
-                self._handle_background_error(func, e)
-            
-            delay_ms = interval_ms - utime.ticks_diff(utime.ticks_ms(), start)
-            await asyncio.sleep_ms(delay_ms)
+                handle_error(func, e)
 
     async def _repeat_with_interval(self, interval_ms, func, *args, **kwargs):
+        sleep_ms = asyncio.sleep_ms
+        handle_error = self._handle_background_error
         while True:
             try:
                 func(*args, **kwargs)
             except BaseException as e:
-                self._handle_background_error(func, e)
+                handle_error(func, e)
 
-            await asyncio.sleep_ms(interval_ms)
+            await sleep_ms(interval_ms)
+
+    async def _run_on_event(self, flag, func, args, kwargs):
+        wait = flag.wait
+        handle_error = self._handle_background_error
+        while True:
+            await wait()
+            try:
+                func(*args, **kwargs)
+            except BaseException as e:
+                handle_error(func, e)
 
     async def _wrap_coroutine(self, coroutine):
         try:
@@ -161,14 +269,19 @@ class MicroApp:
         except BaseException as e:
             print(f"Exception in self-shcheduled co-routine: {coroutine}")
             self._handle_background_error(coroutine, e)
+        finally:
+            # finished tasks take themselves off the list so a long-running app doesn't accumulate them
+            self._scheduled_tasks.remove(asyncio.current_task())
 
 
     def _handle_background_error(self, func, exception):
-        if isinstance(exception, asyncio.CancelledError):
+        # exact type checks: neither exception is subclassed here, and this runs on every failed sensor read
+        exception_type = type(exception)
+        if exception_type is asyncio.CancelledError:
             print("task(s) cancelled")
             raise exception  # don't try to cancel while I'm being cancelled
 
-        if isinstance(exception, KeyboardInterrupt):
+        if exception_type is KeyboardInterrupt:
             print("Received keyboard interrupt. Cancelling main task.")
             self.shutdown = True
             return
@@ -184,7 +297,7 @@ class MicroApp:
 
 
     def _handle_foreground_error(self, main_func, exception):
-        if isinstance(exception, KeyboardInterrupt):
+        if type(exception) is KeyboardInterrupt:
             print("application cancelled.")
             if self.cancel_callback:
                 self.cancel_callback()
@@ -198,27 +311,58 @@ class MicroApp:
         if self.verbose:
             print(f"Running {func.__name__} every {period_ms}ms")
         
+        self._running = True
+        if self._schedule_heap:
+            self._start_scheduler()
+
+        sleep = asyncio.sleep
+        sleep_ms = asyncio.sleep_ms
+        now_ms = self._now_ms
+        heap = self._schedule_heap
+        cancel = MicroApp.CANCEL
         while not self.shutdown:
             self.check_count += 1
         
             should_cancel = func(self)
-            if should_cancel is MicroApp.CANCEL:
+            if should_cancel is cancel:
                 print(f"Ending {func.__name__}")
                 self.shutdown = True
+                await self._shutdown()
                 return
             
-            await asyncio.sleep_ms(period_ms)
+            # wake just after the next scheduled function if that comes first, so func sees its effects straight away
+            delay_ms = period_ms
+            if heap:
+                after_next_ms = heap[0][0] - now_ms() + 1
+                if after_next_ms < delay_ms:
+                    delay_ms = after_next_ms
+            if delay_ms > 0:
+                await sleep_ms(delay_ms)
+            else:
+                await sleep(0)
 
         print("Finishing _main.")
+        await self._shutdown()
         if self.cancel_callback:
             self.cancel_callback()
 
 
+    async def _shutdown(self):
+        """
+        Cancel every background task and wait for them to unwind, so none are left holding their frames once run()
+        returns. cancel() may already have cancelled some of them; gather still collects those.
+        """
+        tasks = list(self._scheduled_tasks)
+        if self._scheduler_task is not None:
+            tasks.append(self._scheduler_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
     def _default_main(self):
         if self.verbose:
-            print("alive: {} times. current time {}:{:02d}:{:02d}T{:02d}:{:02d}:{:02d}".format(
-                self.check_count, *utime.localtime()
-            ))
+            t = utime.localtime()
+            sys.stdout.write(_ALIVE_FMT % (self.check_count, t[0], t[1], t[2], t[3], t[4], t[5]))
         return MicroApp.DONT_CANCEL
         
     def _call_error_handler(self, func, exception):
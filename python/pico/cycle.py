@@ -1,25 +1,39 @@
 
 import asyncio
+from micropython import const
+import utime
+
+
+# Cycle modes, as small ints so checking the mode is an int compare rather than a string compare
+_ON = const(0)
+_OFF = const(1)
+_RUNNING = const(2)
+_CANCELLED = const(3)
+
+_STEADY_CHECKS_BEFORE_BACKOFF = const(10)
+_BACKOFF_FACTOR = const(4)
 
 
 class SlowCycle:
     """
     A class that provides a very slow on-off cycle, measured as period in seconds rather than frequency in Hz
     """
-    ON = "on"
-    OFF = "off"
-    RUNNING = "running"
-    CANCELLED = "cancelled"
+    ON = _ON
+    OFF = _OFF
+    RUNNING = _RUNNING
+    CANCELLED = _CANCELLED
 
-    def __init__(self, pin, cycle_percent=0.5, cycle_period_s=10, check_interval_ms=250):
+    def __init__(self, pin, cycle_percent=0.5, cycle_period_s=10, check_interval_ms=250, verbose=False):
         self.pin = pin
-        self.mode = SlowCycle.OFF
+        self.verbose = verbose
+        self._pin_id = str(pin)  # formatted once rather than on every log line
+        self.mode = _OFF
         self.cycle_percent = cycle_percent
         self.cycle_period_s = cycle_period_s
         self.check_interval_ms = check_interval_ms
 
         self.pin.off()
-        self._pin_state = SlowCycle.OFF
+        self._pin_state = _OFF
         self._on_time_ms = 0
         self._off_time_ms = 0
         self._update_on_off_times()
@@ -38,51 +52,86 @@ class SlowCycle:
         self._update_on_off_times()
 
     def set_mode(self, mode):
-        if mode not in [SlowCycle.ON, SlowCycle.OFF, SlowCycle.RUNNING]:
+        if mode not in (_ON, _OFF, _RUNNING):
             raise ValueError("Invalid cycle mode")
         self.mode = mode
 
     def on(self):
-        self.set_mode(SlowCycle.ON)
-        if self._pin_state != SlowCycle.ON:
-            print(f"Turning on pin {self.pin}")
+        if self.verbose and self._pin_state != _ON:
+            print(f"Turning on pin {self._pin_id}")
+        self.set_mode(_ON)
 
     def off(self):
-        self.set_mode(SlowCycle.OFF)
-        if self._pin_state != SlowCycle.OFF:
-            print(f"Turning off pin {self.pin}")
+        if self.verbose and self._pin_state != _OFF:
+            print(f"Turning off pin {self._pin_id}")
+        self.set_mode(_OFF)
     
     def cycle(self):
-        self.set_mode(SlowCycle.RUNNING)
-        print(f"Cycling pin {self.pin}")
+        if self.verbose and self.mode != _RUNNING:
+            print(f"Cycling pin {self._pin_id}")
+        self.set_mode(_RUNNING)
 
     def shut_down(self):
-        print(f"turning off cycle pin {self.pin}")
-        self.mode = SlowCycle.CANCELLED
+        if self.verbose:
+            print(f"turning off cycle pin {self._pin_id}")
+        self.mode = _CANCELLED
         self.pin.off()
         
 
     async def run(self):
-        while self.mode != SlowCycle.CANCELLED:
-            if self.mode == SlowCycle.ON:
-                self.pin.on()
-                self._pin_state = SlowCycle.ON
-                await asyncio.sleep_ms(self.check_interval_ms)
-            
-            elif self.mode == SlowCycle.OFF:
-                self.pin.off()
-                self._pin_state = SlowCycle.OFF
-                await asyncio.sleep_ms(self.check_interval_ms)
-
-            elif self.mode == SlowCycle.RUNNING and self._pin_state == SlowCycle.OFF:
-                # turn pin on
-                self.pin.on()
-                self._pin_state = SlowCycle.ON
-                await asyncio.sleep_ms(self._on_time_ms)
-
-            elif self.mode == SlowCycle.RUNNING and self._pin_state == SlowCycle.ON:
-                # turn pin off
-                self.pin.off()
-                self._pin_state = SlowCycle.OFF
-                await asyncio.sleep_ms(self._off_time_ms)
-                
\ No newline at end of file
+        pin_on = self.pin.on
+        pin_off = self.pin.off
+        sleep_ms = asyncio.sleep_ms
+        ticks_ms = utime.ticks_ms
+        ticks_diff = utime.ticks_diff
+        ticks_add = utime.ticks_add
+
+        # While cycling, each edge is timed from the previous edge's deadline rather than from whenever we woke up, so
+        # late wake-ups don't stretch the period or skew the duty cycle
+        edge_deadline = None
+        # Held steadily on or off, the pin only needs watching for a mode change, so polling backs off after a while
+        last_mode = None
+        steady_checks = 0
+        while True:
+            mode = self.mode
+            if mode != last_mode:
+                last_mode = mode
+                steady_checks = 0
+            elif steady_checks < _STEADY_CHECKS_BEFORE_BACKOFF:
+                steady_checks += 1
+
+            if mode == _RUNNING:
+                if self._pin_state == _OFF:
+                    # turn pin on
+                    pin_on()
+                    self._pin_state = _ON
+                    phase_ms = self._on_time_ms
+                else:
+                    # turn pin off
+                    pin_off()
+                    self._pin_state = _OFF
+                    phase_ms = self._off_time_ms
+
+                now = ticks_ms()
+                # just started cycling, or fell more than a whole phase behind: resync instead of bursting to catch up
+                if edge_deadline is None or ticks_diff(now, edge_deadline) > phase_ms:
+                    edge_deadline = now
+                edge_deadline = ticks_add(edge_deadline, phase_ms)
+                delay_ms = ticks_diff(edge_deadline, now)
+                await sleep_ms(delay_ms if delay_ms > 0 else 0)
+
+            elif mode == _ON or mode == _OFF:
+                if self._pin_state != mode:
+                    if mode == _ON:
+                        pin_on()
+                    else:
+                        pin_off()
+                    self._pin_state = mode
+                edge_deadline = None
+                if steady_checks < _STEADY_CHECKS_BEFORE_BACKOFF:
+                    await sleep_ms(self.check_interval_ms)
+                else:
+                    await sleep_ms(self.check_interval_ms * _BACKOFF_FACTOR)
+
+            elif mode == _CANCELLED:
+                return
@@ -1,4 +1,6 @@
+from array import array
 from machine import ADC
+import micropython
 
 class Analog:
     """
@@ -18,10 +20,48 @@ class Analog:
         self.scale = scale * self.TO_FLOAT 
         self.offset = offset
 
-    def read_float(self):
+        # Reads are bound per instance with everything they need captured as default arguments, so a sample is only
+        # local loads plus the ADC call. scale and offset are fixed once the Analog is built.
+
         # read an analog value as an int and convert to float
-        return self.adc.read_u16() * self.scale + self.offset
-    
-    def read_int(self):
+        self.read_float = lambda r=self.adc.read_u16, s=self.scale, o=self.offset: r() * s + o
+
         # read an analog value as an int
-        return self.adc.read_u16()
+        self.read_int = self.adc.read_u16
+
+    @micropython.native
+    def read_float_block(self, buf):
+        """
+        Fill buf, e.g. a preallocated array('f'), with consecutive scaled samples in one native loop, so averaging or
+        filtering a batch doesn't pay interpreter overhead per sample.
+        """
+        read_u16 = self.adc.read_u16
+        scale = self.scale
+        offset = self.offset
+        for i in range(len(buf)):
+            buf[i] = read_u16() * scale + offset
+
+
+class AnalogBank:
+    """
+    Several ADC channels read together. Scales and offsets live in flat float arrays rather than in one Analog object
+    per channel, and read_all fills every channel in one native loop. Each channel maps [0 1] to [min max] like
+    Analog.build.
+    """
+
+    def __init__(self, pins, min_outputs, max_outputs):
+        self.adcs = tuple(ADC(pin) for pin in pins)
+        self.scales = array('f', [(hi - lo) * Analog.TO_FLOAT for lo, hi in zip(min_outputs, max_outputs)])
+        self.offsets = array('f', min_outputs)
+
+    def __len__(self):
+        return len(self.adcs)
+
+    @micropython.native
+    def read_all(self, out):
+        """ Fill out, e.g. a preallocated array('f', [0.0] * len(bank)), with one scaled sample per channel """
+        adcs = self.adcs
+        scales = self.scales
+        offsets = self.offsets
+        for i in range(len(adcs)):
+            out[i] = adcs[i].read_u16() * scales[i] + offsets[i]
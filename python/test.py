@@ -4,6 +4,9 @@ from utime import sleep, sleep_ms
 
 LED_PIN = "LED"
 TEMP_PIN = 4
+# Pico thermister: volts = raw * 3.3 / 65535, celsius = 27 - (volts - 0.706) / 0.001721
+TEMP_VOLTS_PER_COUNT = 3.3 / 65535
+TEMP_C_PER_VOLT = 1 / 0.001721
 led = Pin("LED", Pin.OUT)
 relays = [
     Pin(10, Pin.OUT),
@@ -36,15 +39,17 @@ def main():
 
 def check_thermister():
     temp_pin = ADC(TEMP_PIN)
-    print(f"Temperature pin: {temp_pin.read_u16()}")
+    # read once so every check below is about the same sample
+    raw = temp_pin.read_u16()
+    print(f"Temperature pin: {raw}")
 
-    if temp_pin.read_u16() in (0, 65535):
+    if raw in (0, 65535):
         raise ValueError("Temperature pin value is suspicious")
     
-    temp_voltage = temp_pin.read_u16() * 3.3 / 65535
+    temp_voltage = raw * TEMP_VOLTS_PER_COUNT
     print(f"Temperature voltage: {temp_voltage}V")
     
-    temp_celsius = 27 - (temp_voltage - 0.706) / 0.001721
+    temp_celsius = 27 - (temp_voltage - 0.706) * TEMP_C_PER_VOLT
     print(f"Temperature: {temp_celsius}º°C")
     
 